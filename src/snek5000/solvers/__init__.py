@@ -9,7 +9,7 @@ Solver framework
 
 """
 import importlib
-from functools import partial
+from functools import lru_cache, partial
 from pkgutil import ModuleInfo
 from types import ModuleType
 
@@ -22,8 +22,12 @@ available_solvers.__doc__ = """\
 Returns a dictionary of all registered solvers registered as an entrypoint.
 """
 
-import_cls_simul = partial(loader.import_cls_simul, entrypoint_grp="snek5000.solvers")
-import_cls_simul.__doc__ = """Import the Simul class of a solver."""
+import_cls_simul = lru_cache(maxsize=None)(
+    partial(loader.import_cls_simul, entrypoint_grp="snek5000.solvers")
+)
+import_cls_simul.__doc__ = (
+    """Import the Simul class of a solver. The result is cached."""
+)
 
 
 def is_package(module):
@@ -13,10 +13,22 @@ from ..params import load_params
 
 
 def _is_empty_directory(path):
-    path = Path(path)
-    if not path.is_dir():
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is None
+    except (FileNotFoundError, NotADirectoryError):
         return False
-    return not bool(os.listdir(path))
+
+
+def _strip_suffixes(stem, suffixes):
+    """Remove suffixes from the end of a stem, for example: ``.tar`` from
+    ``test.tar``.
+
+    """
+    for suffix in suffixes:
+        if stem.endswith(suffix):
+            stem = stem[: -len(suffix)]
+    return stem
 
 
 def next_path(old_path, force_suffix=False, return_suffix=False):
@@ -32,12 +44,13 @@ def next_path(old_path, force_suffix=False, return_suffix=False):
         a suffix in the end.
 
     return_suffix:
-        If true, returns the integer suffix along with the path/
+        If true, returns the integer suffix along with the path.
 
     Returns
     -------
-    (i, new_path): tuple[int, Path]
-        If `return_suffix` is `True`.
+    (i, new_path): tuple[int | None, Path]
+        If `return_suffix` is `True`. The integer suffix `i` is `None` if no
+        suffix was added.
 
     new_path: Path
         A path (with an integer suffix) which does not yet exist in the
@@ -66,28 +79,37 @@ def next_path(old_path, force_suffix=False, return_suffix=False):
     >>> Path("test_00.txt").unlink()
 
     """
-
-    def int_suffix(p, integer):
-        stem = p.stem
-        # for example: remove .tar from the end, if any
-        for suffix in p.suffixes:
-            stem = re.sub(f"{suffix}$", "", stem)
-
-        return p.parent / "".join([stem, f"_{integer:02d}", *p.suffixes])
-
     old_path = Path(old_path)
 
     if not force_suffix and not (
-        old_path.exists() and not _is_empty_directory(old_path)
+        os.path.lexists(old_path) and not _is_empty_directory(old_path)
     ):
-        return old_path
+        return (None, old_path) if return_suffix else old_path
+
+    stem = _strip_suffixes(old_path.stem, old_path.suffixes)
+    suffixes = "".join(old_path.suffixes)
+
+    # Enumerate the parent directory once, instead of checking the existence
+    # of every candidate path
+    pattern = re.compile(rf"^{re.escape(stem)}_(\d{{2,}}){re.escape(suffixes)}\Z")
+    used = set()
+    try:
+        with os.scandir(old_path.parent) as entries:
+            for entry in entries:
+                match = pattern.match(entry.name)
+                if not match or (entry.is_dir() and _is_empty_directory(entry.path)):
+                    continue
+                # skip names which are never generated, for example: test_000
+                integer = int(match.group(1))
+                if f"{integer:02d}" == match.group(1):
+                    used.add(integer)
+    except FileNotFoundError:
+        pass
 
     i = 0
-    new_path = int_suffix(old_path, i)
-    while new_path.exists() and not _is_empty_directory(new_path):
-        logger.debug(f"Path exists: {new_path}")
+    while i in used:
         i += 1
-        new_path = int_suffix(old_path, i)
+    new_path = old_path.parent / f"{stem}_{i:02d}{suffixes}"
 
     logger.debug(f"Next path available: {new_path}")
 
@@ -119,9 +141,14 @@ def create_session(case, re2, ma2, par):
         # use relative paths to avoid 132 character limit in Nek5000
         session_name.write(f"{case}\n./{session_dir}\n")
 
-    for file in (re2, ma2):
-        # use relative symlinks
-        (session_dir / file).symlink_to(f"../{file}")
+    # open the session directory once to avoid resolving its path per symlink
+    dir_fd = os.open(session_dir, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        for file in (re2, ma2):
+            # use relative symlinks
+            os.symlink(f"../{file}", file, dir_fd=dir_fd)
+    finally:
+        os.close(dir_fd)
 
     # Copy par files to run without recompiling
     copy2(par, session_dir / par)
@@ -3,9 +3,11 @@
 
 """
 import os
+import re
 import sys
 from enum import Enum
 from pathlib import Path
+from stat import S_ISDIR
 from textwrap import dedent
 
 from fluidsim_core.scripts.restart import RestarterABC
@@ -16,6 +18,9 @@ from ..params import load_params
 from ..solvers import get_solver_short_name, import_cls_simul
 from .files import _path_try_from_fluidsim_path, next_path
 
+#: Multi-file checkpoints, equivalent to the glob pattern ``rs6*0.f?????``
+_regex_checkpoint = re.compile(r"rs6.*0\.f\d{5}\Z")
+
 
 class SnekRestartError(Exception):
     pass
@@ -67,7 +72,39 @@ class SimStatus(Enum):
         self.message = message  #: helpful description
 
 
-def get_status(path_dir, session_id=None, verbose=False):
+def _is_dir(path):
+    """Check if a path is a directory with a single stat syscall."""
+    try:
+        return S_ISDIR(os.stat(path).st_mode)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
+def _any_field_file(path_dir):
+    """Check if a directory contains at least one field file, i.e. a file
+    matching the glob pattern ``*0.f?????`` with digits.
+
+    """
+    try:
+        entries = os.scandir(path_dir)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if (
+                len(name) >= 8
+                and name[-8:-5] == "0.f"
+                and name[-5:].isdecimal()
+                and entry.is_file()
+            ):
+                return True
+
+    return False
+
+
+def get_status(path_dir, session_id=None, verbose=False, params=None):
     """Get status of a simulation run by verifying its contents. It checks if:
 
     - snakemake was ever executed
@@ -84,6 +121,9 @@ def get_status(path_dir, session_id=None, verbose=False):
         Integer suffix of the session directory
     verbose : bool
         Print out the path and its contents
+    params : :class:`snek5000.params.Parameters`
+        Parameters of the simulation, if already loaded. Only used when
+        ``session_id`` is not given.
 
     Returns
     -------
@@ -91,34 +131,58 @@ def get_status(path_dir, session_id=None, verbose=False):
         Enumeration indicating status code and message
 
     """
-    path = Path(path_dir)
+    # Plain strings are used instead of Path objects, since os.scandir and
+    # os.path functions accept them directly
+    path = os.fspath(path_dir)
     if session_id:
-        path_session = _make_path_session(path, session_id)
+        path_session = os.fspath(_make_path_session(path, session_id))
     else:
-        path_session = Path(load_params(path_dir).output.path_session)
+        if params is None:
+            params = load_params(path_dir)
+        path_session = os.fspath(params.output.path_session)
 
-    locks_dir = path / ".snakemake" / "locks"
-    contents = os.listdir(path)
+    path_snakemake = os.path.join(path, ".snakemake")
+    locks_dir = os.path.join(path_snakemake, "locks")
 
     if verbose:
-        print(path, "\nContents:", contents)
-
-    if not (path / ".snakemake").exists():
-        return SimStatus.TOO_EARLY
-    elif locks_dir.exists():
-        locks = tuple(locks_dir.iterdir())
-        if locks:
-            return SimStatus.LOCKED
+        print(path, "\nContents:", os.listdir(path))
 
-    if not {"SIZE", "nek5000"}.issubset(contents):
+    # Check the cheap early exits before enumerating the directory. If the
+    # locks directory can be opened, .snakemake exists and needs no stat.
+    try:
+        with os.scandir(locks_dir) as locks:
+            if next(locks, None) is not None:
+                return SimStatus.LOCKED
+    except (FileNotFoundError, NotADirectoryError):
+        if not _is_dir(path_snakemake):
+            return SimStatus.TOO_EARLY
+
+    # Classify the contents of the directory in a single pass, which stops as
+    # soon as everything is found
+    has_size = has_nek5000 = has_checkpoint = False
+    with os.scandir(path) as entries:
+        for entry in entries:
+            name = entry.name
+            # DirEntry.is_file does not require a stat syscall on most
+            # filesystems, since the file type is returned by readdir
+            if name == "SIZE":
+                has_size = entry.is_file()
+            elif name == "nek5000":
+                has_nek5000 = entry.is_file()
+            elif not has_checkpoint and name.startswith("rs6"):
+                has_checkpoint = bool(_regex_checkpoint.match(name)) and entry.is_file()
+
+            if has_size and has_nek5000 and has_checkpoint:
+                break
+
+    if not (has_size and has_nek5000):
         return SimStatus.NOT_FOUND
 
-    checkpoints = set(path.glob("rs6*0.f?????"))
-    field_files = set(path_session.glob("*0.f?????"))
+    has_field_files = _any_field_file(path_session)
 
-    if checkpoints and field_files:
+    if has_checkpoint and has_field_files:
         return SimStatus.RESET_CONTENT
-    elif field_files:
+    elif has_field_files:
         return SimStatus.PARTIAL_CONTENT
     else:
         return SimStatus.OK
@@ -169,7 +233,7 @@ def load_for_restart(
     How it works:
 
     - If ``verify contents`` is `True`, do so using :func:`get_status`
-    - Reads ``params_simul.xml`` if it exists, and if not falls back to ``.par`` file.
+    - Reads ``params_simul.xml``, which is required.
     - Modifies parameters (in memory, but does not write into the filesystem,
       yet) ``start_from`` (Nek5000) or checkpoint module (requires KTH
       framework) with appropriate ``chkp_fnumber`` to restart from.
@@ -181,12 +245,16 @@ def load_for_restart(
     if session_id is None:
         path, session_id = _parse_path_run_session_id(path)
 
+    # Fail fast, before detecting the solver and parsing files
+    if not os.path.lexists(os.path.join(path, "params_simul.xml")):
+        raise SnekRestartError(f"No params_simul.xml file found in {path}")
+
     try:
         params = load_params(path)
     except (ValueError, OSError) as err:
         raise SnekRestartError(err) from err
 
-    status = get_status(path, session_id or params.output.session_id)
+    status = get_status(path, session_id or params.output.session_id, params=params)
 
     if verify_contents:
         if status.code >= 400:
@@ -260,17 +328,19 @@ def load_for_restart(
         params.output.session_id = new_session_id
         params.output.path_session = new_path_session
         if not only_check:
+            # Check the restart file before touching the filesystem, so that no
+            # empty session directory is left behind on failure
+            if use_start_from and not path_start_from.exists():
+                raise SnekRestartError(f"Restart file {path_start_from} not found")
+
             new_path_session.mkdir(exist_ok=True)
 
-        if not only_check and use_start_from:
-            if path_start_from.exists():
+            if use_start_from:
                 params.nek.general.start_from = name_restart_file
                 src = f"../{old_path_session.name}/{path_start_from.name}"
                 dest = new_path_session / name_restart_file
                 logger.debug(f"Symlinking {dest} -> {src}")
                 dest.symlink_to(src)
-            else:
-                raise SnekRestartError(f"Restart file {path_start_from} not found")
 
     return params, Simul
 
@@ -15,6 +15,28 @@ def test_next_path_no_files(tmpdir):
     )
 
 
+def test_next_path_suffixes_regex_characters(tmpdir):
+    tmpdir = Path(tmpdir)
+
+    # Suffixes should be stripped literally, not as regular expressions
+    target = tmpdir / "test.v[1].c++"
+
+    assert str(files.next_path(target, force_suffix=True)) == str(
+        tmpdir / "test_00.v[1].c++"
+    )
+
+
+def test_next_path_trailing_newline(tmpdir):
+    tmpdir = Path(tmpdir)
+
+    # A trailing newline makes a different file name
+    (tmpdir / "test_00.txt\n").touch()
+
+    assert files.next_path(tmpdir / "test.txt", force_suffix=True) == (
+        tmpdir / "test_00.txt"
+    )
+
+
 def test_next_path_one_file(tmpdir):
     tmpdir = Path(tmpdir)
 
@@ -51,6 +73,31 @@ def test_next_path_two_files(tmpdir):
     )
 
 
+def test_next_path_return_suffix(tmpdir):
+    tmpdir = Path(tmpdir)
+
+    target = tmpdir / "test.txt"
+    assert files.next_path(target, return_suffix=True) == (None, target)
+
+    target.touch()
+    assert files.next_path(target, return_suffix=True) == (
+        0,
+        tmpdir / "test_00.txt",
+    )
+
+
+def test_next_path_broken_symlink(tmpdir):
+    tmpdir = Path(tmpdir)
+
+    # Broken symlinks are considered as existing paths
+    target = tmpdir / "test.txt"
+    target.symlink_to(tmpdir / "missing.txt")
+    assert files.next_path(target) == tmpdir / "test_00.txt"
+
+    (tmpdir / "test_00.txt").symlink_to(tmpdir / "missing.txt")
+    assert files.next_path(target) == tmpdir / "test_01.txt"
+
+
 def test_next_path_dir_no_suffix(tmpdir):
     tmpdir = Path(tmpdir)
 
@@ -90,3 +137,18 @@ def test_next_path_relative(tmpdir):
 
     if session_dir.is_absolute():
         raise ValueError("next_path should return a relative path")
+
+
+def test_next_path_skip_empty_dir(tmpdir):
+    tmpdir = Path(tmpdir)
+
+    # Empty directories can be reused, but not directories with contents
+    (tmpdir / "session_00").mkdir()
+    (tmpdir / "session_00" / "foo").touch()
+    (tmpdir / "session_01").mkdir()
+    (tmpdir / "session_02").mkdir()
+    (tmpdir / "session_02" / "foo").touch()
+
+    assert files.next_path(tmpdir / "session", force_suffix=True) == (
+        tmpdir / "session_01"
+    )
@@ -3,8 +3,10 @@ import xarray as xr
 from pymech.neksuite.field import read_header
 
 import snek5000
+from fluidsim_core import loader
 from snek5000.output import _make_path_session
 from snek5000.params import load_params
+from snek5000.solvers import import_cls_simul
 from snek5000.util.restart import SnekRestartError, get_status, load_for_restart
 
 
@@ -23,6 +25,19 @@ def test_locked(sim_data):
     assert get_status(sim_data).code == 423
 
 
+def test_too_early_snakemake_file(sim_data):
+    (sim_data / ".snakemake").touch()
+
+    assert get_status(sim_data).code == 425
+
+
+def test_locks_file(sim_data):
+    (sim_data / ".snakemake").mkdir()
+    (sim_data / ".snakemake" / "locks").touch()
+
+    assert get_status(sim_data).code == 205
+
+
 def test_ok(sim_data):
     (sim_data / ".snakemake").mkdir()
     session = _make_path_session(sim_data, 1)
@@ -31,15 +46,38 @@ def test_ok(sim_data):
     assert get_status(sim_data).code == 200
 
 
+def test_ok_session_not_a_dir(sim_data):
+    (sim_data / ".snakemake").mkdir()
+    (sim_data / "session_02").touch()
+
+    assert get_status(sim_data, 2).code == 200
+
+
 def test_reset_content(sim_data):
     (sim_data / ".snakemake").mkdir()
 
     assert get_status(sim_data).code == 205
 
 
-def test_not_found(sim_data):
+@pytest.mark.parametrize("name", ("nek5000", "SIZE"))
+def test_not_found(sim_data, name):
     (sim_data / ".snakemake").mkdir()
+    (sim_data / name).unlink()
+
+    assert get_status(sim_data).code == 404
+
+
+def test_not_found_not_a_file(sim_data):
+    (sim_data / ".snakemake").mkdir()
+    (sim_data / "SIZE").unlink()
+    (sim_data / "SIZE").mkdir()
+
+    assert get_status(sim_data).code == 404
+
+    (sim_data / "SIZE").rmdir()
+    (sim_data / "SIZE").touch()
     (sim_data / "nek5000").unlink()
+    (sim_data / "nek5000").symlink_to("missing_nek5000")
 
     assert get_status(sim_data).code == 404
 
@@ -52,13 +90,50 @@ def test_partial_content(sim_data):
     assert get_status(sim_data).code == 206
 
 
+def test_status_params(sim_data):
+    (sim_data / ".snakemake").mkdir()
+    params = load_params(sim_data)
+    params.output.path_session = sim_data / "session_empty"
+
+    assert get_status(sim_data).code == 205
+    assert get_status(sim_data, params=params).code == 200
+
+
+def test_restart_import_cached(sim_data, monkeypatch):
+    calls = []
+    import_module_solver = loader.import_module_solver
+
+    def import_module_solver_counted(*args, **kwargs):
+        calls.append(args)
+        return import_module_solver(*args, **kwargs)
+
+    monkeypatch.setattr(loader, "import_module_solver", import_module_solver_counted)
+    import_cls_simul.cache_clear()
+
+    (sim_data / ".snakemake").mkdir()
+    for _ in range(2):
+        load_for_restart(sim_data, use_checkpoint=1, only_check=True)
+
+    assert len(calls) == 1
+
+
 @pytest.mark.parametrize("prefix_dir", ("phill_", "undefined_solver"))
 def test_restart_error(tmpdir_factory, prefix_dir):
     tmpdir = tmpdir_factory.mktemp(prefix_dir)
-    with pytest.raises(SnekRestartError):
+    with pytest.raises(SnekRestartError, match="No params_simul.xml"):
         load_for_restart(tmpdir)
 
 
+def test_restart_missing_file(sim_data):
+    (sim_data / ".snakemake").mkdir()
+
+    with pytest.raises(SnekRestartError, match="Restart file .* not found"):
+        load_for_restart(sim_data, use_start_from="phill0.f99999")
+
+    # no new session directory should be left behind
+    assert not (sim_data / "session_02").exists()
+
+
 @pytest.mark.slow
 def test_restart(sim_executed):
     # In real workflows, to pre load data in preperation for restart, use: